@@ -33,6 +33,25 @@ class Settings(BaseSettings):
     groq_model: str = "llama-3.3-70b-versatile"
     llm_temperature: float = 0.7
     llm_max_tokens: int = 2000
+    # Output cap for one batched request; stays under the models' output limits
+    llm_batch_max_tokens: int = 16000
+    
+    # Fast tier for classification-shaped calls
+    fast_llm_provider: str = "groq"
+    fast_llm_model: str = "llama-3.1-8b-instant"
+    
+    # Response caching for repeated verses
+    response_cache_maxsize: int = 1024
+    response_cache_ttl_seconds: int = 3600
+    
+    # Chandas micro-batching
+    chandas_batch_max_size: int = 8
+    chandas_batch_max_wait_ms: int = 20
+    chandas_max_inflight_batches: int = 4
+    
+    # Meaning batch extraction
+    meaning_batch_size: int = 8
+    meaning_batch_max_chars: int = 12000
     
     # Qdrant Configuration
     qdrant_host: str = "localhost"
@@ -7,10 +7,17 @@ import json
 from typing import Dict, Any, List, Optional
 import base64
 
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
 from models import ChatRequest, ChatResponse, ChatMessage
 from services.llm_client import get_llm_client
 from services.rag_client import get_rag_client
 from config import get_settings
+from utils.helpers import read_prompt
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -27,21 +34,13 @@ class ChatbotController:
     
     def _load_system_prompt(self) -> str:
         """Load chatbot system prompt"""
-        try:
-            with open("prompts/chatbot_system.txt", 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            # Fallback system prompt
-            return """You are a Sanskrit AI assistant specialized in helping users with Sanskrit language processing."""
+        # Fallback system prompt
+        return read_prompt("prompts/chatbot_system.txt") or """You are a Sanskrit AI assistant specialized in helping users with Sanskrit language processing."""
     
     def _load_krishna_prompt(self) -> str:
         """Load Krishna persona prompt"""
-        try:
-            with open("prompts/krishna_persona.txt", 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            # Fallback Krishna prompt
-            return """You are Lord Krishna, sharing divine wisdom and guidance with devotees."""
+        # Fallback Krishna prompt
+        return read_prompt("prompts/krishna_persona.txt") or """You are Lord Krishna, sharing divine wisdom and guidance with devotees."""
     
     async def process_chat(
         self, 
@@ -116,7 +115,7 @@ class ChatbotController:
             
             logger.info(f"✅ Chatbot response generated successfully")
             
-            return ChatResponse(
+            return ChatResponse.construct_trusted(
                 response=response_text,
                 input_detected=user_query,
                 sources=sources,
@@ -181,7 +180,8 @@ class ChatbotController:
     async def _transcribe_audio(self, audio_path: str) -> str:
         """Transcribe audio to text using OpenAI Whisper"""
         try:
-            import openai
+            if not OPENAI_AVAILABLE:
+                raise RuntimeError("openai package not installed")
             
             client = openai.OpenAI(api_key=settings.openai_api_key)
             
@@ -201,7 +201,8 @@ class ChatbotController:
     async def _extract_text_from_image(self, image_path: str) -> str:
         """Extract text from image using GPT-4 Vision"""
         try:
-            import openai
+            if not OPENAI_AVAILABLE:
+                raise RuntimeError("openai package not installed")
             
             # Read and encode image
             with open(image_path, 'rb') as image_file:
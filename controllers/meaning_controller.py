@@ -2,18 +2,91 @@
 Meaning Controller - Business logic for Sanskrit translation and meaning extraction
 """
 
+import asyncio
 import logging
-import json
-from typing import Dict, Any
+import string
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from models import MeaningRequest, MeaningResponse
 from services.llm_client import get_llm_client
 from services.rag_client import get_rag_client
 from config import get_settings
+from utils.helpers import read_prompt, SingleFlightCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Translation reported when the LLM response could not be parsed
+_FAILED_TRANSLATION = "Unable to translate"
+
+# Validates a result dict into the response model in one pass
+_RESPONSE_ADAPTER = TypeAdapter(MeaningResponse)
+
+
+def _cache_key(request: MeaningRequest) -> Tuple[str, bool, bool]:
+    """Key a request by verse and the options that change its response"""
+    return (request.verse, request.include_word_meanings, request.include_context)
+
+
+def _is_cacheable(response: MeaningResponse) -> bool:
+    """Don't pin a failed parse for the whole TTL"""
+    return response.translation != _FAILED_TRANSLATION
+
+_GRAMMAR_CONTEXT = """
+Sanskrit Grammar Reference:
+- Nominal cases: 8 cases (vibhakti) - nominative to locative
+- Sandhi rules: Vowel and consonant combination rules
+- Samasa: Compound formations (tatpurusha, bahuvrihi, etc.)
+- Verb forms: Present, past, future tenses with various moods
+
+Common patterns:
+- -म् (-m) ending: Neuter nominative/accusative singular
+- -ः (-ḥ) ending: Masculine nominative singular
+- -ा (-ā) ending: Feminine nominative singular
+"""
+
+# User prompt built once; only the per-request pieces are substituted
+_USER_PROMPT_TEMPLATE = string.Template("""Translate and analyze this Sanskrit verse:
+
+Verse: ${verse}
+
+${wm_line}
+${ctx_line}
+
+Grammar reference:
+${grammar}
+
+Provide:
+1. Complete accurate English translation
+2. Word-by-word breakdown (if requested)
+3. Historical/cultural context (if requested)
+4. Grammatical notes (case, sandhi, compounds, etc.)
+5. Interesting and unique facts - what makes this shloka special
+6. Unknown/obscure facts - rare interpretations, hidden meanings, scholarly insights
+
+Return as JSON with fields: translation, word_meanings (dict), context, unique_facts, unknown_facts, notes""")
+
+# Several verses sharing the same options, answered in one request
+_BATCH_PROMPT_TEMPLATE = string.Template("""Translate and analyze each of these ${count} Sanskrit verses:
+
+${verses}
+
+${wm_line}
+${ctx_line}
+
+Grammar reference:
+${grammar}
+
+For each verse provide a complete accurate English translation, word-by-word breakdown (if requested),
+historical/cultural context (if requested), grammatical notes, unique facts and unknown/obscure facts.
+
+Return ONLY valid JSON of the form {"results": [...]} with exactly one object per verse, in the same order,
+each with fields: translation, word_meanings (dict), context, unique_facts, unknown_facts, notes""")
+
 
 class MeaningController:
     """Controller for Sanskrit meaning extraction"""
@@ -22,14 +95,16 @@ class MeaningController:
         self.llm_client = get_llm_client()
         self.rag_client = get_rag_client()
         self.system_prompt = self._load_system_prompt()
+        
+        # Responses for recently seen verse/option combinations
+        self._cache = SingleFlightCache(
+            maxsize=settings.response_cache_maxsize,
+            ttl=settings.response_cache_ttl_seconds
+        )
     
     def _load_system_prompt(self) -> str:
         """Load meaning extraction system prompt"""
-        try:
-            with open("prompts/meaning_system.txt", 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            return """You are an expert Sanskrit scholar and translator.
+        return read_prompt("prompts/meaning_system.txt") or """You are an expert Sanskrit scholar and translator.
 Your task is to provide accurate translations, detailed word-by-word meanings, and interesting facts.
 
 Provide:
@@ -61,96 +136,198 @@ Return response as JSON with:
         try:
             logger.info(f"📖 Extracting meaning for verse")
             
-            # Get grammar context if needed
-            context = ""
-            if request.include_context:
-                context = await self._get_grammar_context()
+            return await self._cache.get_or_create(
+                _cache_key(request),
+                lambda: self._extract_meaning(request),
+                cache_if=_is_cacheable
+            )
             
-            # Build user prompt
-            user_prompt = f"""Translate and analyze this Sanskrit verse:
-
-Verse: {request.verse}
-
-{"Include word-by-word meanings." if request.include_word_meanings else ""}
-{"Include historical and cultural context." if request.include_context else ""}
-
-Grammar reference:
-{context}
-
-Provide:
-1. Complete accurate English translation
-2. Word-by-word breakdown (if requested)
-3. Historical/cultural context (if requested)
-4. Grammatical notes (case, sandhi, compounds, etc.)
-5. Interesting and unique facts - what makes this shloka special
-6. Unknown/obscure facts - rare interpretations, hidden meanings, scholarly insights
-
-Return as JSON with fields: translation, word_meanings (dict), context, unique_facts, unknown_facts, notes"""
+        except Exception as e:
+            logger.error(f"Meaning extraction failed: {str(e)}")
+            raise
+    
+    async def _extract_meaning(self, request: MeaningRequest) -> MeaningResponse:
+        """Run the LLM translation for a verse that isn't cached"""
+        # Build user prompt
+        user_prompt = _USER_PROMPT_TEMPLATE.substitute(
+            verse=request.verse,
+            wm_line="Include word-by-word meanings." if request.include_word_meanings else "",
+            ctx_line="Include historical and cultural context." if request.include_context else "",
+            grammar=self._get_grammar_context() if request.include_context else ""
+        )
+        
+        # Get LLM response
+        response_text = await self.llm_client.structured_completion(
+            system_prompt=self.system_prompt,
+            user_prompt=user_prompt,
+            temperature=0.3  # Lower temperature for accuracy
+        )
+        
+        # Parse response
+        result = self._parse_llm_response(response_text)
+        
+        logger.info(f"✅ Translation completed")
+        
+        return _RESPONSE_ADAPTER.validate_python(result)
+    
+    async def extract_meanings_batch(self, requests: List[MeaningRequest]) -> List[MeaningResponse]:
+        """
+        Extract meanings for several verses, bundling them into shared LLM requests
+        
+        Verses already in the response cache are served from it, and a verse
+        repeated within the batch is translated once. The rest are grouped by
+        options and sent up to meaning_batch_size at a time; chunks that would
+        be too large, or whose answer can't be split back per verse, fall back
+        to individual extract_meaning calls.
+        
+        Args:
+            requests: Meaning extraction requests
             
-            # Get LLM response
-            response_text = await self.llm_client.structured_completion(
-                system_prompt=self.system_prompt,
-                user_prompt=user_prompt,
-                temperature=0.3  # Lower temperature for accuracy
+        Returns:
+            One MeaningResponse per request, in input order
+        """
+        try:
+            logger.info(f"📖 Extracting meaning for {len(requests)} verses")
+            
+            results: List[Optional[MeaningResponse]] = [None] * len(requests)
+            
+            # Serve cached verses directly and send each distinct uncached
+            # verse to the LLM once, however often it repeats in the batch
+            pending: Dict[Tuple[str, bool, bool], List[int]] = {}
+            for index, request in enumerate(requests):
+                key = _cache_key(request)
+                cached = self._cache.get(key)
+                if cached is not None:
+                    results[index] = cached
+                else:
+                    pending.setdefault(key, []).append(index)
+            
+            # Only verses sharing options can share a prompt
+            groups: Dict[Tuple[bool, bool], List[Tuple[str, bool, bool]]] = {}
+            for key in pending:
+                groups.setdefault(key[1:], []).append(key)
+            
+            size = max(1, settings.meaning_batch_size)
+            chunks = [
+                keys[start:start + size]
+                for keys in groups.values()
+                for start in range(0, len(keys), size)
+            ]
+            
+            chunk_results = await asyncio.gather(
+                *(self._extract_chunk([requests[pending[key][0]] for key in chunk]) for chunk in chunks)
             )
             
-            # Parse response
-            result = self._parse_llm_response(response_text)
+            for chunk, responses in zip(chunks, chunk_results):
+                for key, response in zip(chunk, responses):
+                    if _is_cacheable(response):
+                        self._cache.set(key, response)
+                    for index in pending[key]:
+                        results[index] = response
             
-            logger.info(f"✅ Translation completed")
+            logger.info(f"✅ Batch translation completed")
             
-            return MeaningResponse(**result)
+            return results
             
         except Exception as e:
-            logger.error(f"Meaning extraction failed: {str(e)}")
+            logger.error(f"Batch meaning extraction failed: {str(e)}")
             raise
     
-    async def _get_grammar_context(self) -> str:
-        """Get grammar rules context"""
+    async def _extract_chunk(self, requests: List[MeaningRequest]) -> List[MeaningResponse]:
+        """Translate verses sharing the same options with one LLM request"""
+        total_chars = sum(len(request.verse) for request in requests)
+        if len(requests) == 1 or total_chars > settings.meaning_batch_max_chars:
+            return await asyncio.gather(*(self.extract_meaning(request) for request in requests))
+        
+        first = requests[0]
+        user_prompt = _BATCH_PROMPT_TEMPLATE.substitute(
+            count=len(requests),
+            verses="\n\n".join(
+                f"Verse {i}: {request.verse}" for i, request in enumerate(requests, start=1)
+            ),
+            wm_line="Include word-by-word meanings." if first.include_word_meanings else "",
+            ctx_line="Include historical and cultural context." if first.include_context else "",
+            grammar=self._get_grammar_context() if first.include_context else ""
+        )
+        
+        response_text = await self.llm_client.structured_completion(
+            system_prompt=self.system_prompt,
+            user_prompt=user_prompt,
+            temperature=0.3,
+            max_tokens=min(settings.llm_max_tokens * len(requests), settings.llm_batch_max_tokens)
+        )
+        
         try:
-            return """
-Sanskrit Grammar Reference:
-- Nominal cases: 8 cases (vibhakti) - nominative to locative
-- Sandhi rules: Vowel and consonant combination rules
-- Samasa: Compound formations (tatpurusha, bahuvrihi, etc.)
-- Verb forms: Present, past, future tenses with various moods
-
-Common patterns:
-- -म् (-m) ending: Neuter nominative/accusative singular
-- -ः (-ḥ) ending: Masculine nominative singular
-- -ा (-ā) ending: Feminine nominative singular
-"""
+            items = self._load_json(response_text).get("results")
         except Exception as e:
-            logger.warning(f"Failed to get grammar context: {str(e)}")
-            return ""
+            logger.warning(f"Batched response was not valid JSON: {str(e)[:100]}")
+            items = None
+        
+        if (
+            not isinstance(items, list)
+            or len(items) != len(requests)
+            or not all(isinstance(item, dict) for item in items)
+        ):
+            logger.warning("Could not split batched response, translating verses individually")
+            return await asyncio.gather(*(self.extract_meaning(request) for request in requests))
+        
+        # Validate per verse so one malformed item doesn't fail the whole batch
+        responses: List[Optional[MeaningResponse]] = []
+        retry: List[int] = []
+        for index, item in enumerate(items):
+            try:
+                responses.append(_RESPONSE_ADAPTER.validate_python(item))
+            except ValidationError as e:
+                logger.warning(f"Batched result {index + 1} failed validation, translating it individually: {str(e)[:100]}")
+                responses.append(None)
+                retry.append(index)
+        
+        if retry:
+            retried = await asyncio.gather(*(self.extract_meaning(requests[i]) for i in retry))
+            for index, response in zip(retry, retried):
+                responses[index] = response
+        
+        return responses
+    
+    def _get_grammar_context(self) -> str:
+        """Get grammar rules context"""
+        return _GRAMMAR_CONTEXT
+    
+    def _load_json(self, response_text: str) -> Any:
+        """Decode the JSON payload of an LLM response, tolerating markdown fences"""
+        json_str = response_text.strip()
+        
+        # Fast path: JSON-mode responses are already a bare object
+        if json_str.startswith("{"):
+            try:
+                return orjson.loads(json_str)
+            except orjson.JSONDecodeError:
+                pass
+        
+        # Extract JSON from markdown code blocks
+        _, fence, rest = response_text.partition("```json")
+        if not fence:
+            _, fence, rest = response_text.partition("```")
+        if fence:
+            json_str = rest.partition("```")[0].strip()
+        
+        return orjson.loads(json_str)
     
     def _parse_llm_response(self, response_text: str) -> Dict[str, Any]:
         """Parse LLM response to extract structured data"""
         try:
-            # Extract JSON
-            if "```json" in response_text:
-                json_str = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_str = response_text.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response_text.strip()
-            
-            data = json.loads(json_str)
-            
-            # Set defaults
-            data.setdefault("translation", "")
-            data.setdefault("word_meanings", {})
-            data.setdefault("context", "")
-            data.setdefault("unique_facts", "")
-            data.setdefault("unknown_facts", "")
-            data.setdefault("notes", "")
+            data = self._load_json(response_text)
+            
+            if not isinstance(data, dict):
+                raise ValueError("LLM response is not a JSON object")
             
+            # Missing fields are filled by the response model's defaults
             return data
             
         except Exception as e:
             logger.error(f"Failed to parse LLM response: {str(e)}")
             return {
-                "translation": "Unable to translate",
+                "translation": _FAILED_TRANSLATION,
                 "word_meanings": {},
                 "context": "",
                 "unique_facts": "",
@@ -161,13 +338,17 @@ Common patterns:
 
 # Singleton instance
 _meaning_controller: MeaningController = None
+_meaning_controller_lock = threading.Lock()
 
 
 def get_meaning_controller() -> MeaningController:
     """Get or create meaning controller singleton"""
     global _meaning_controller
     
+    # Double-checked so concurrent first calls construct only one instance
     if _meaning_controller is None:
-        _meaning_controller = MeaningController()
+        with _meaning_controller_lock:
+            if _meaning_controller is None:
+                _meaning_controller = MeaningController()
     
     return _meaning_controller
@@ -10,6 +10,7 @@ from models import ShlokaGenerateRequest, ShlokaGenerateResponse
 from services.llm_client import get_llm_client
 from services.rag_client import get_rag_client
 from config import get_settings
+from utils.helpers import read_prompt
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -25,11 +26,7 @@ class ShlokaController:
     
     def _load_system_prompt(self) -> str:
         """Load shloka generation system prompt"""
-        try:
-            with open("prompts/shloka_generate.txt", 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            return """You are an expert Sanskrit poet and scholar.
+        return read_prompt("prompts/shloka_generate.txt") or """You are an expert Sanskrit poet and scholar.
 Your task is to compose beautiful, grammatically correct Sanskrit shlokas.
 
 Generate high-quality Sanskrit verses that:
@@ -127,8 +124,7 @@ Displaying valor and great strength,
 The hero's prowess shines in battle."""
             }
             
-            mood_key = request.mood.value if hasattr(request.mood, 'value') else str(request.mood)
-            return examples.get(mood_key, examples["devotional"])
+            return examples.get(request.mood, examples["devotional"])
             
         except Exception as e:
             logger.warning(f"Failed to get examples: {str(e)}")
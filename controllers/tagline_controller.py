@@ -10,6 +10,7 @@ from models import TaglineGenerateRequest, TaglineGenerateResponse, TaglineVaria
 from services.llm_client import get_llm_client
 from services.rag_client import get_rag_client
 from config import get_settings
+from utils.helpers import read_prompt
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -25,11 +26,7 @@ class TaglineController:
     
     def _load_system_prompt(self) -> str:
         """Load tagline system prompt"""
-        try:
-            with open("prompts/tagline_system.txt", 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            return """You are an expert in Sanskrit language and corporate branding.
+        return read_prompt("prompts/tagline_system.txt") or """You are an expert in Sanskrit language and corporate branding.
 Your task is to create impactful Sanskrit taglines for modern businesses.
 
 Create taglines that:
@@ -5,6 +5,7 @@ Voice Karaoke Controller - Sanskrit pronunciation analysis
 import logging
 import json
 import os
+import re
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
@@ -18,6 +19,7 @@ from models import (
 from services.llm_client import get_llm_client
 from services.rag_client import get_rag_client
 from config import get_settings
+from utils.helpers import read_prompt
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -33,12 +35,8 @@ class VoiceController:
     
     def _load_system_prompt(self) -> str:
         """Load voice analysis system prompt"""
-        try:
-            with open("prompts/voice_system.txt", 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            # Fallback system prompt
-            return """You are an expert in Sanskrit pronunciation and prosody. Analyze transcribed Sanskrit text against reference shlokas to identify pronunciation errors, syllable mismatches, and meter deviations. Provide detailed, constructive feedback."""
+        # Fallback system prompt
+        return read_prompt("prompts/voice_system.txt") or """You are an expert in Sanskrit pronunciation and prosody. Analyze transcribed Sanskrit text against reference shlokas to identify pronunciation errors, syllable mismatches, and meter deviations. Provide detailed, constructive feedback."""
     
     async def transcribe_audio(self, audio_file_path: str) -> str:
         """
@@ -209,9 +207,6 @@ Return ONLY valid JSON:
             )
             
             # Parse JSON response
-            import json
-            import re
-            
             json_str = response_text.strip()
             if "```json" in json_str:
                 json_str = json_str.split("```json")[1].split("```")[0].strip()
@@ -409,7 +404,6 @@ Return ONLY valid JSON with scores and feedback."""
             
             # Find JSON object
             if not json_str.startswith("{"):
-                import re
                 json_match = re.search(r'\{.*\}', json_str, re.DOTALL)
                 if json_match:
                     json_str = json_match.group(0)
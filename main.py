@@ -9,8 +9,14 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.utils import get_openapi
 import time
+from typing import Any, Dict
 
+from services.llm_client import close_llm_client
+from controllers import get_chandas_controller, get_meaning_controller
+from utils.helpers import check_unique_routes
+from utils.responses import ORJSONResponse
 from routes import (
     chandas_routes,
     shloka_routes,
@@ -42,9 +48,14 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     logger.info("🚀 SvaramAI starting...")
+    # Build the hot-path controllers before the first request arrives
+    get_chandas_controller()
+    get_meaning_controller()
     logger.info("✅ All modules initialized")
     yield
     logger.info("👋 SvaramAI shutting down...")
+    await get_chandas_controller().aclose()
+    await close_llm_client()
 
 
 # Initialize FastAPI app
@@ -52,7 +63,8 @@ app = FastAPI(
     title="SvaramAI - Sanskrit Intelligence Suite",
     description="Production-grade AI backend for Sanskrit language processing with Chandas identification, Shloka generation, RAG knowledge base, and more.",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -173,12 +185,48 @@ app.include_router(voice_routes.router)
 app.include_router(chatbot_routes.router, tags=["Chatbot"])
 
 
+# Fail at startup if two handlers are registered for the same path and method
+check_unique_routes(app.routes)
+
+
+def custom_openapi() -> Dict[str, Any]:
+    """Build the OpenAPI schema on first request, attaching model examples"""
+    if app.openapi_schema:
+        return app.openapi_schema
+    
+    # Examples are only needed for the docs, so load them here
+    from examples import EXAMPLES
+    
+    schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes
+    )
+    
+    # Models may be split into "-Input"/"-Output" component variants
+    for name, component in schema.get("components", {}).get("schemas", {}).items():
+        example = EXAMPLES.get(name.split("-", 1)[0])
+        if example is not None:
+            component["example"] = example
+    
+    app.openapi_schema = schema
+    return schema
+
+
+app.openapi = custom_openapi
+
+
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # C event loop and HTTP parser from uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
@@ -2,23 +2,43 @@
 Pydantic models for all API endpoints
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Dict, Optional, Any, Literal, Union
 from enum import Enum
 
 
+# ==================== BASE MODELS ====================
+
+# Shared by every response model; they are never mutated after construction.
+# OpenAPI examples are attached lazily in main.custom_openapi.
+_RESPONSE_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
+class TrustedModel(BaseModel):
+    """Base for response models the controllers build from their own data"""
+    
+    @classmethod
+    def construct_trusted(cls, **data: Any):
+        """
+        Build an instance without validation
+        
+        Only for values produced by our own code, never for client input or
+        raw LLM output - those still go through normal validation.
+        
+        Args:
+            **data: Field values, already of the declared types
+            
+        Returns:
+            Model instance with the given fields marked as set
+        """
+        return cls.model_construct(_fields_set=set(data), **data)
+
+
 # ==================== CHANDAS IDENTIFIER MODELS ====================
 
 class ChandasIdentifyRequest(BaseModel):
     """Request model for chandas identification"""
     shloka: str = Field(..., description="Sanskrit shloka text to analyze")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "shloka": "वसुदेवसुतं देवं कंसचाणूरमर्दनम्"
-            }
-        }
 
 
 class SyllableInfo(BaseModel):
@@ -36,60 +56,16 @@ class IdentificationStep(BaseModel):
     result: str = Field(..., description="Result of this step")
 
 
-class ChandasIdentifyResponse(BaseModel):
+class ChandasIdentifyResponse(TrustedModel):
     """Response model for chandas identification"""
-    chandas_name: str = Field(..., description="Identified meter name")
-    syllable_breakdown: List[SyllableInfo] = Field(..., description="Syllable-wise breakdown")
-    laghu_guru_pattern: str = Field(..., description="Pattern representation (L/G or |/S)")
-    explanation: str = Field(..., description="Detailed explanation of the meter")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
+    chandas_name: str = Field("Unknown", description="Identified meter name")
+    syllable_breakdown: List[SyllableInfo] = Field(default_factory=list, description="Syllable-wise breakdown")
+    laghu_guru_pattern: str = Field("", description="Pattern representation (L/G or |/S)")
+    explanation: str = Field("", description="Detailed explanation of the meter")
+    confidence: float = Field(0.5, ge=0.0, le=1.0, description="Confidence score")
     identification_process: List[IdentificationStep] = Field(default_factory=list, description="Step-by-step mathematical process of how chandas was identified")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "chandas_name": "Anushtup",
-                "syllable_breakdown": [
-                    {"syllable": "va", "type": "laghu", "position": 1},
-                    {"syllable": "su", "type": "laghu", "position": 2}
-                ],
-                "laghu_guru_pattern": "LGGLGGLG",
-                "explanation": "This is Anushtup meter with 8 syllables per quarter",
-                "confidence": 0.95,
-                "identification_process": [
-                    {
-                        "step_number": 1,
-                        "step_name": "Text Preprocessing",
-                        "description": "Remove punctuation and normalize text",
-                        "result": "Cleaned text ready for syllable extraction"
-                    },
-                    {
-                        "step_number": 2,
-                        "step_name": "Syllable Segmentation",
-                        "description": "Split text into syllables using Devanagari script rules",
-                        "result": "32 syllables detected"
-                    },
-                    {
-                        "step_number": 3,
-                        "step_name": "Laghu-Guru Classification",
-                        "description": "Classify each syllable as Laghu (short) or Guru (long) based on vowel length and conjunct consonants",
-                        "result": "Pattern: LGGLGGLG LGGLGGLG LGGLGGLG LGGLGGLG"
-                    },
-                    {
-                        "step_number": 4,
-                        "step_name": "Pattern Matching",
-                        "description": "Match against known chandas patterns in database",
-                        "result": "Matched: Anushtup (32 syllables, 8 per quarter)"
-                    },
-                    {
-                        "step_number": 5,
-                        "step_name": "Confidence Calculation",
-                        "description": "Calculate confidence based on pattern match quality",
-                        "result": "Confidence: 0.95 (Exact match)"
-                    }
-                ]
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== SHLOKA ANALYZE MODELS ====================
@@ -97,13 +73,6 @@ class ChandasIdentifyResponse(BaseModel):
 class ShlokaAnalyzeRequest(BaseModel):
     """Request model for shloka analysis"""
     verse: str = Field(..., description="Sanskrit verse text to analyze")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "verse": "वसुदेवसुतं देवं कंसचाणूरमर्दनम्"
-            }
-        }
 
 
 class ShlokaAnalyzeResponse(BaseModel):
@@ -117,22 +86,7 @@ class ShlokaAnalyzeResponse(BaseModel):
     detected: bool = Field(..., description="Whether metre was successfully detected")
     llm_output: Optional[Dict[str, Any]] = Field(default=None, description="LLM-based analysis and commentary")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "metre": "Anushtup",
-                "scheme": "8-8-8-8",
-                "laghu_guru_pattern": "LGGLGGLG LGGLGGLG LGGLGGLG LGGLGGLG",
-                "confidence": 0.95,
-                "syllable_count": [8, 8, 8, 8],
-                "gana_pattern": "ma-ya-ra-ta",
-                "detected": True,
-                "llm_output": {
-                    "explanation": "This verse follows the Anushtup metre...",
-                    "commentary": "A well-structured verse in classical Sanskrit meter"
-                }
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== SHLOKA GENERATOR MODELS ====================
@@ -146,6 +100,9 @@ class MoodEnum(str, Enum):
     peaceful = "peaceful"
     energetic = "energetic"
 
+# Fields use the literal type (a plain membership check); the enum is kept for imports
+MoodLiteral = Literal["devotional", "philosophical", "heroic", "romantic", "peaceful", "energetic"]
+
 
 class StyleEnum(str, Enum):
     """Style options for shloka generation"""
@@ -154,25 +111,16 @@ class StyleEnum(str, Enum):
     vedic = "vedic"
     puranic = "puranic"
 
+StyleLiteral = Literal["classical", "modern", "vedic", "puranic"]
+
 
 class ShlokaGenerateRequest(BaseModel):
     """Request model for shloka generation"""
     theme: str = Field(..., description="Main theme or subject")
     deity: Optional[str] = Field(None, description="Deity name if devotional")
-    mood: MoodEnum = Field(MoodEnum.devotional, description="Emotional tone")
-    style: StyleEnum = Field(StyleEnum.classical, description="Literary style")
+    mood: MoodLiteral = Field("devotional", description="Emotional tone")
+    style: StyleLiteral = Field("classical", description="Literary style")
     meter: Optional[str] = Field(None, description="Specific chandas to use")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "theme": "Krishna's divine play",
-                "deity": "Krishna",
-                "mood": "devotional",
-                "style": "classical",
-                "meter": "Anushtup"
-            }
-        }
 
 
 class ShlokaGenerateResponse(BaseModel):
@@ -182,15 +130,7 @@ class ShlokaGenerateResponse(BaseModel):
     meaning: str = Field(..., description="English translation and explanation")
     pattern: str = Field(..., description="Laghu-Guru pattern")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "shloka": "वसुदेवसुतं देवं कंसचाणूरमर्दनम्।\nदेवकीपरमानन्दं कृष्णं वन्दे जगद्गुरुम्॥",
-                "meter": "Anushtup",
-                "meaning": "I bow to Krishna, son of Vasudeva, destroyer of Kamsa and Chanura, supreme joy of Devaki, teacher of the world.",
-                "pattern": "LGGLGGLG LGGLGGLG"
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== TAGLINE GENERATOR MODELS ====================
@@ -204,6 +144,8 @@ class ToneEnum(str, Enum):
     spiritual = "spiritual"
     powerful = "powerful"
 
+ToneLiteral = Literal["professional", "inspiring", "traditional", "modern", "spiritual", "powerful"]
+
 
 class TaglineGenerateRequest(BaseModel):
     """Request model for Sanskrit tagline generation"""
@@ -211,18 +153,7 @@ class TaglineGenerateRequest(BaseModel):
     company_name: str = Field(..., description="Company or brand name")
     vision: str = Field(..., description="Company vision or mission")
     values: List[str] = Field(..., description="Core values")
-    tone: ToneEnum = Field(ToneEnum.professional, description="Desired tone")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "industry": "Technology",
-                "company_name": "TechVeda",
-                "vision": "Empowering digital transformation",
-                "values": ["innovation", "excellence", "integrity"],
-                "tone": "professional"
-            }
-        }
+    tone: ToneLiteral = Field("professional", description="Desired tone")
 
 
 class TaglineVariant(BaseModel):
@@ -239,21 +170,7 @@ class TaglineGenerateResponse(BaseModel):
     meaning: str = Field(..., description="Detailed meaning and context")
     variants: List[TaglineVariant] = Field(..., description="Alternative versions")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "tagline": "ज्ञानं शक्तिः प्रौद्योगिक्या",
-                "english_translation": "Knowledge is power through technology",
-                "meaning": "Combining ancient wisdom with modern technology",
-                "variants": [
-                    {
-                        "tagline": "नवीनता परम्परायाः",
-                        "translation": "Innovation from tradition",
-                        "context": "Emphasizes traditional roots"
-                    }
-                ]
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== MEANING ENGINE MODELS ====================
@@ -263,46 +180,38 @@ class MeaningRequest(BaseModel):
     verse: str = Field(..., description="Sanskrit verse or text")
     include_word_meanings: bool = Field(True, description="Include word-by-word breakdown")
     include_context: bool = Field(True, description="Include historical/cultural context")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "verse": "सत्यं ज्ञानमनन्तं ब्रह्म",
-                "include_word_meanings": True,
-                "include_context": True
-            }
-        }
 
 
-class MeaningResponse(BaseModel):
+class MeaningResponse(TrustedModel):
     """Response model for meaning extraction"""
-    translation: str = Field(..., description="Complete English translation")
-    word_meanings: Dict[str, str] = Field(..., description="Word-by-word meanings")
-    context: str = Field(..., description="Historical and cultural context")
+    translation: str = Field("", description="Complete English translation")
+    word_meanings: Dict[str, str] = Field(default_factory=dict, description="Word-by-word meanings")
+    context: str = Field("", description="Historical and cultural context")
     unique_facts: str = Field(default="", description="Interesting and unique facts about the shloka")
     unknown_facts: str = Field(default="", description="Lesser-known or obscure facts")
-    notes: str = Field(..., description="Additional grammatical or interpretive notes")
+    notes: str = Field("", description="Additional grammatical or interpretive notes")
+    
+    model_config = _RESPONSE_CONFIG
+
+
+class MeaningBatchRequest(BaseModel):
+    """Request model for extracting meanings of several verses at once"""
+    items: List[MeaningRequest] = Field(..., min_length=1, max_length=100, description="Verses to translate, in order")
+
+
+class MeaningBatchResponse(BaseModel):
+    """Response model for batch meaning extraction"""
+    results: List[MeaningResponse] = Field(default_factory=list, description="One result per requested verse, in order")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "translation": "Truth, Knowledge, Infinite is Brahman",
-                "word_meanings": {
-                    "सत्यम्": "truth, reality",
-                    "ज्ञानम्": "knowledge, wisdom",
-                    "अनन्तम्": "infinite, endless",
-                    "ब्रह्म": "Brahman, the absolute"
-                },
-                "context": "From Taittiriya Upanishad, defining the nature of Brahman",
-                "unique_facts": "This definition appears in three Taittiriya texts and forms the basis of Advaita Vedanta philosophy",
-                "unknown_facts": "Some scholars believe this formulation influenced Buddhist epistemology",
-                "notes": "All three words are in neuter gender, nominative case"
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== KNOWLEDGE BASE MODELS ====================
 
+# Metadata accepted on writes; stored as flat scalar payload fields in Qdrant
+MetadataValue = Union[str, int, float, bool, None]
+
+
 class CollectionEnum(str, Enum):
     """Available collections in knowledge base"""
     chandas_patterns = "chandas_patterns"
@@ -310,47 +219,29 @@ class CollectionEnum(str, Enum):
     grammar_rules = "grammar_rules"
     branding_vocab = "branding_vocab"
 
+CollectionLiteral = Literal["chandas_patterns", "example_shlokas", "grammar_rules", "branding_vocab"]
+
 
 class DocumentAddRequest(BaseModel):
     """Request to add document to knowledge base"""
-    collection: CollectionEnum = Field(..., description="Target collection")
+    collection: CollectionLiteral = Field(..., description="Target collection")
     content: str = Field(..., description="Document content")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Document metadata")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "collection": "chandas_patterns",
-                "content": "Anushtup: 8 syllables per quarter, 32 total. Pattern: flexible with 5th syllable laghu",
-                "metadata": {
-                    "name": "Anushtup",
-                    "category": "sama-vritta",
-                    "syllables": 32
-                }
-            }
-        }
+    metadata: Dict[str, MetadataValue] = Field(default_factory=dict, description="Document metadata")
 
 
 class DocumentSearchRequest(BaseModel):
     """Request to search documents"""
-    collection: CollectionEnum = Field(..., description="Collection to search")
+    collection: CollectionLiteral = Field(..., description="Collection to search")
     query: str = Field(..., description="Search query")
     limit: int = Field(5, ge=1, le=50, description="Maximum results")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "collection": "chandas_patterns",
-                "query": "meters with 8 syllables",
-                "limit": 5
-            }
-        }
 
 
 class SearchResult(BaseModel):
     """A single search result"""
     id: str
     content: str
+    # Read side stays Any: points stored before metadata was narrowed may
+    # carry lists or nested values
     metadata: Dict[str, Any]
     score: float
 
@@ -360,33 +251,20 @@ class DocumentSearchResponse(BaseModel):
     results: List[SearchResult] = Field(..., description="Search results")
     total: int = Field(..., description="Total number of results")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "results": [
-                    {
-                        "id": "doc_001",
-                        "content": "Anushtup meter description",
-                        "metadata": {"name": "Anushtup"},
-                        "score": 0.95
-                    }
-                ],
-                "total": 1
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 class DocumentUpdateRequest(BaseModel):
     """Request to update a document"""
-    collection: CollectionEnum = Field(..., description="Collection name")
+    collection: CollectionLiteral = Field(..., description="Collection name")
     document_id: str = Field(..., description="Document ID to update")
     content: Optional[str] = Field(None, description="New content")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="New metadata")
+    metadata: Optional[Dict[str, MetadataValue]] = Field(None, description="New metadata")
 
 
 class DocumentDeleteRequest(BaseModel):
     """Request to delete a document"""
-    collection: CollectionEnum = Field(..., description="Collection name")
+    collection: CollectionLiteral = Field(..., description="Collection name")
     document_id: str = Field(..., description="Document ID to delete")
 
 
@@ -395,6 +273,8 @@ class OperationResponse(BaseModel):
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Status message")
     data: Optional[Dict[str, Any]] = Field(None, description="Additional data")
+    
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== VOICE ANALYZER MODELS ====================
@@ -402,13 +282,6 @@ class OperationResponse(BaseModel):
 class VoiceAnalyzeRequest(BaseModel):
     """Request for voice karaoke analysis"""
     reference_shloka: Optional[str] = Field(None, description="Expected shloka (optional, will auto-detect if not provided)")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "reference_shloka": "वसुदेवसुतं देवं कंसचाणूरमर्दनम्"
-            }
-        }
 
 
 class PronunciationError(BaseModel):
@@ -451,38 +324,7 @@ class VoiceAnalyzeResponse(BaseModel):
     suggestions: str = Field(..., description="Personalized improvement suggestions")
     overall_feedback: str = Field(..., description="Overall performance feedback")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "transcribed_text": "वसुदेव सुतं देवं कंसचाणूरमर्दनम्",
-                "identified_shloka": {
-                    "text": "वसुदेवसुतं देवं कंसचाणूरमर्दनम्।\nदेवकीपरमानन्दं कृष्णं वन्दे जगद्गुरुम्॥",
-                    "source": "Krishna Stotram",
-                    "meter": "Anushtup",
-                    "meaning": "I bow to Krishna, son of Vasudeva, destroyer of Kamsa and Chanura, supreme joy of Devaki, teacher of the world.",
-                    "confidence": 0.92
-                },
-                "accuracy_metrics": {
-                    "overall_accuracy": 0.87,
-                    "word_accuracy": 0.90,
-                    "syllable_accuracy": 0.85,
-                    "meter_accuracy": 0.88,
-                    "pronunciation_clarity": 0.84
-                },
-                "errors": [
-                    {
-                        "position": 1,
-                        "expected": "वसुदेवसुतं",
-                        "actual": "वसुदेव सुतं",
-                        "error_type": "syllable_mismatch",
-                        "severity": "minor",
-                        "note": "Added extra space between compound words"
-                    }
-                ],
-                "suggestions": "Focus on connecting compound words smoothly. Practice the 'dev' sound with proper dental pronunciation.",
-                "overall_feedback": "Good attempt! Your pronunciation is 87% accurate. Main areas for improvement: compound word joining and dental consonant clarity."
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== CHATBOT MODELS ====================
@@ -493,12 +335,16 @@ class InputTypeEnum(str, Enum):
     voice = "voice"
     image = "image"
 
+InputTypeLiteral = Literal["text", "voice", "image"]
+
 
 class PersonaEnum(str, Enum):
     """AI persona options"""
     default = "default"
     krishna = "krishna"
 
+PersonaLiteral = Literal["default", "krishna"]
+
 
 class ChatMessage(BaseModel):
     """A single chat message"""
@@ -510,22 +356,12 @@ class ChatMessage(BaseModel):
 class ChatRequest(BaseModel):
     """Request model for chatbot"""
     message: Optional[str] = Field(None, description="Text message (required if input_type=text)")
-    input_type: InputTypeEnum = Field(InputTypeEnum.text, description="Type of input")
-    persona: PersonaEnum = Field(PersonaEnum.default, description="AI persona to use")
+    input_type: InputTypeLiteral = Field("text", description="Type of input")
+    persona: PersonaLiteral = Field("default", description="AI persona to use")
     conversation_history: List[ChatMessage] = Field(default_factory=list, description="Previous conversation context")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "What is Anushtup meter?",
-                "input_type": "text",
-                "persona": "default",
-                "conversation_history": []
-            }
-        }
-
-
-class ChatResponse(BaseModel):
+
+
+class ChatResponse(TrustedModel):
     """Response model from chatbot"""
     response: str = Field(..., description="Chatbot response text")
     input_detected: str = Field(..., description="Detected/transcribed input from user")
@@ -533,20 +369,7 @@ class ChatResponse(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Response confidence")
     suggestions: List[str] = Field(default_factory=list, description="Follow-up question suggestions")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "response": "Anushtup is the most common Sanskrit meter, consisting of 32 syllables divided into 4 quarters of 8 syllables each. It's widely used in epics like Mahabharata and Ramayana.",
-                "input_detected": "What is Anushtup meter?",
-                "sources": ["Chandas Knowledge Base", "Example Shlokas"],
-                "confidence": 0.95,
-                "suggestions": [
-                    "How do I identify Anushtup meter?",
-                    "What are other common Sanskrit meters?",
-                    "Can you show me an example of Anushtup?"
-                ]
-            }
-        }
+    model_config = _RESPONSE_CONFIG
 
 
 # ==================== COMMON MODELS ====================
@@ -556,3 +379,5 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[Any] = Field(None, description="Additional error details")
+    
+    model_config = _RESPONSE_CONFIG
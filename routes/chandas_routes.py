@@ -9,16 +9,22 @@ from models import ChandasIdentifyRequest, ChandasIdentifyResponse, ShlokaAnalyz
 from controllers import get_chandas_controller, ChandasController
 from services.chandas_service import ChandasService
 from services.llm_service import LLMService
+from utils.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+async def _chandas_controller() -> ChandasController:
+    """Resolve the controller singleton inline rather than in the threadpool"""
+    return get_chandas_controller()
+
+
 @router.post("/chandas/identify", response_model=ChandasIdentifyResponse)
 async def identify_chandas(
     request: ChandasIdentifyRequest,
-    controller: ChandasController = Depends(get_chandas_controller)
+    controller: ChandasController = Depends(_chandas_controller)
 ):
     """
     Identify the chandas (meter) of a Sanskrit shloka with detailed mathematical process explanation
@@ -41,9 +47,9 @@ async def identify_chandas(
     """
     try:
         result = await controller.identify_chandas(request)
-        return result
+        return ORJSONResponse(result.model_dump())
     except Exception as e:
-        logger.error(f"Chandas identification failed: {str(e)}")
+        logger.error("Chandas identification failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to identify chandas: {str(e)}"
@@ -72,8 +78,7 @@ async def analyze_shloka(request: ShlokaAnalyzeRequest):
             raise HTTPException(status_code=422, detail="Field 'verse' is required and cannot be empty")
         
         # Step 1: Identify metre using chandas service
-        chandas_service = ChandasService()
-        metre_info = chandas_service.identify_metre(request.verse)
+        metre_info = await ChandasService.identify_metre_async(request.verse)
         
         # Step 2: Get LLM analysis (optional)
         llm_analysis = None
@@ -81,7 +86,7 @@ async def analyze_shloka(request: ShlokaAnalyzeRequest):
             llm_service = LLMService()
             llm_analysis = await llm_service.analyze_with_metre(request.verse, metre_info)
         except Exception as e:
-            logger.debug(f"LLM analysis not available: {e}")
+            logger.debug("LLM analysis not available: %s", e)
         
         # Step 3: Build response
         response = ShlokaAnalyzeResponse(
@@ -95,13 +100,13 @@ async def analyze_shloka(request: ShlokaAnalyzeRequest):
             llm_output=llm_analysis
         )
         
-        logger.info(f"Successfully analyzed shloka: {metre_info.get('metre', 'Unknown')}")
-        return response
+        logger.info("Successfully analyzed shloka: %s", metre_info.get("metre", "Unknown"))
+        return ORJSONResponse(response.model_dump())
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Shloka analysis failed: {str(e)}")
+        logger.error("Shloka analysis failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to analyze shloka: {str(e)}"
@@ -3,19 +3,159 @@ Routes for Chatbot API - Multimodal Sanskrit AI assistant
 """
 
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+import asyncio
 import logging
 import tempfile
 import os
-import json
-from typing import Optional, List, Union
+import sys
+from typing import Any, Optional, List, Tuple, Union
+
+import anyio.to_thread
+import orjson
+from pydantic import ValidationError
 
 from models import ChatRequest, ChatResponse, ChatMessage, InputTypeEnum
 from controllers.chatbot_controller import get_chatbot_controller, ChatbotController
+from utils.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Uploads are copied to disk this many bytes at a time
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Resolved once; gettempdir() otherwise re-checks on every call
+_TMP_DIR = tempfile.gettempdir()
+
+# Accepted input types and upload content types
+_VALID_INPUT_TYPES = frozenset(map(sys.intern, ("text", "voice", "image")))
+_ALLOWED_AUDIO = frozenset(map(sys.intern, (
+    "audio/wav", "audio/mpeg", "audio/mp3", "audio/x-m4a", "audio/flac", "audio/ogg", "audio/mp4"
+)))
+_ALLOWED_IMAGE = frozenset(map(sys.intern, ("image/jpeg", "image/png", "image/jpg")))
+
+# Invariant validation failure messages; each request raises a fresh
+# HTTPException so no shared instance holds on to a request's traceback
+_INVALID_INPUT_DETAIL = "Invalid input_type. Must be 'text', 'voice', or 'image'"
+_MESSAGE_REQUIRED_DETAIL = "Message is required for text input"
+_AUDIO_REQUIRED_DETAIL = "Audio file is required for voice input. Please upload an audio file (wav, mp3, m4a, flac, ogg) in the 'audio' field."
+_IMAGE_REQUIRED_DETAIL = "Image file is required for image input"
+
+# History entries with only these keys can skip validation
+_PLAIN_MESSAGE_KEYS = frozenset({"role", "content"})
+
+
+def _is_plain_message(msg: Any) -> bool:
+    """Cheap check that a history entry is a well-formed role/content pair"""
+    return (
+        isinstance(msg, dict)
+        and msg.keys() <= _PLAIN_MESSAGE_KEYS
+        and isinstance(msg.get("role"), str)
+        and isinstance(msg.get("content"), str)
+    )
+
+
+async def _spill(upload: UploadFile, suffix: str) -> Tuple[str, int]:
+    """
+    Copy an upload to a temp file in 1 MiB chunks
+    
+    Args:
+        upload: Uploaded file
+        suffix: Temp file suffix (original extension)
+        
+    Returns:
+        Tuple of (temp file path, bytes written)
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=_TMP_DIR)
+    total = 0
+    try:
+        try:
+            while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+                total += len(chunk)
+        finally:
+            os.close(fd)
+    except BaseException:
+        # The caller never sees the path, so don't leave a partial file behind
+        os.unlink(path)
+        raise
+    return path, total
+
+
+async def _safe_unlink(path: Optional[str], label: str) -> None:
+    """Delete a temp file in a worker thread, ignoring files already gone"""
+    if not path:
+        return
+    try:
+        await anyio.to_thread.run_sync(os.unlink, path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Failed to delete temp %s file: %s", label, e)
+
+
+async def _prepare_text(
+    message: Optional[str],
+    audio_file: Optional[UploadFile],
+    image_file: Optional[UploadFile]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Validate text input; nothing is saved"""
+    if not message or not message.strip():
+        raise HTTPException(status_code=400, detail=_MESSAGE_REQUIRED_DETAIL)
+    return None, None
+
+
+async def _prepare_voice(
+    message: Optional[str],
+    audio_file: Optional[UploadFile],
+    image_file: Optional[UploadFile]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Validate the audio upload and save it to a temp file"""
+    if not audio_file:
+        logger.error("Voice input requested but audio_file is None. Raw audio param type: %s, value: %s", type(audio_file), audio_file)
+        raise HTTPException(status_code=400, detail=_AUDIO_REQUIRED_DETAIL)
+    
+    if audio_file.content_type not in _ALLOWED_AUDIO:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported audio format: %s. Allowed: wav, mp3, m4a, flac, ogg" % audio_file.content_type
+        )
+    
+    audio_path, size = await _spill(audio_file, os.path.splitext(audio_file.filename)[1])
+    logger.info("📥 Audio file saved: %s (%d bytes)", audio_file.filename, size)
+    return audio_path, None
+
+
+async def _prepare_image(
+    message: Optional[str],
+    audio_file: Optional[UploadFile],
+    image_file: Optional[UploadFile]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Validate the image upload and save it to a temp file"""
+    if not image_file:
+        raise HTTPException(status_code=400, detail=_IMAGE_REQUIRED_DETAIL)
+    
+    if image_file.content_type not in _ALLOWED_IMAGE:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported image format: %s" % image_file.content_type
+        )
+    
+    image_path, size = await _spill(image_file, os.path.splitext(image_file.filename)[1])
+    logger.info("📥 Image file saved: %s (%d bytes)", image_file.filename, size)
+    return None, image_path
+
+
+# Input validation/saving per input_type; returns (audio_path, image_path)
+_INPUT_HANDLERS = {
+    "text": _prepare_text,
+    "voice": _prepare_voice,
+    "image": _prepare_image,
+}
+
 
 @router.post("/api/v1/chat", response_model=ChatResponse)
 async def chat(
@@ -64,85 +204,33 @@ async def chat(
     """
     try:
         # Debug logging
-        logger.info(f"🔍 Received - audio: {audio}, image: {image}, input_type: {input_type}")
+        logger.info("🔍 Received - audio: %s, image: %s, input_type: %s", audio, image, input_type)
         
         # FastAPI returns UploadFile or None - use them directly
         audio_file = audio
         image_file = image
         
         # Validate input type
-        if input_type not in ["text", "voice", "image"]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid input_type: {input_type}. Must be 'text', 'voice', or 'image'"
-            )
+        if input_type not in _VALID_INPUT_TYPES:
+            raise HTTPException(status_code=400, detail=_INVALID_INPUT_DETAIL)
         
         # Parse conversation history
         history = []
         if conversation_history:
             try:
-                history_data = json.loads(conversation_history)
-                history = [ChatMessage(**msg) for msg in history_data]
-            except Exception as e:
-                logger.warning(f"Failed to parse conversation history: {str(e)}")
-        
-        # Handle different input types
-        audio_path = None
-        image_path = None
-        
-        if input_type == "text":
-            if not message or not message.strip():
-                raise HTTPException(
-                    status_code=400,
-                    detail="Message is required for text input"
-                )
+                history_data = orjson.loads(conversation_history)
+                # Well-formed entries are constructed directly; anything else
+                # still goes through full validation
+                history = [
+                    ChatMessage.model_construct(**msg) if _is_plain_message(msg) else ChatMessage(**msg)
+                    for msg in history_data
+                ]
+            except (orjson.JSONDecodeError, ValidationError, TypeError) as e:
+                # Malformed history is dropped rather than failing the request
+                logger.warning("Failed to parse conversation history: %s", e)
         
-        elif input_type == "voice":
-            if not audio_file:
-                logger.error(f"Voice input requested but audio_file is None. Raw audio param type: {type(audio)}, value: {audio}")
-                raise HTTPException(
-                    status_code=400,
-                    detail="Audio file is required for voice input. Please upload an audio file (wav, mp3, m4a, flac, ogg) in the 'audio' field."
-                )
-            
-            # Validate audio format
-            allowed_audio = {"audio/wav", "audio/mpeg", "audio/mp3", "audio/x-m4a", "audio/flac", "audio/ogg", "audio/mp4"}
-            if audio_file.content_type not in allowed_audio:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported audio format: {audio_file.content_type}. Allowed: wav, mp3, m4a, flac, ogg"
-                )
-            
-            # Save audio temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(audio_file.filename)[1]) as tmp:
-                content = await audio_file.read()
-                tmp.write(content)
-                audio_path = tmp.name
-            
-            logger.info(f"📥 Audio file saved: {audio_file.filename} ({len(content)} bytes)")
-        
-        elif input_type == "image":
-            if not image_file:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Image file is required for image input"
-                )
-            
-            # Validate image format
-            allowed_images = {"image/jpeg", "image/png", "image/jpg"}
-            if image_file.content_type not in allowed_images:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported image format: {image_file.content_type}"
-                )
-            
-            # Save image temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(image_file.filename)[1]) as tmp:
-                content = await image_file.read()
-                tmp.write(content)
-                image_path = tmp.name
-            
-            logger.info(f"📥 Image file saved: {image_file.filename} ({len(content)} bytes)")
+        # Validate and save the input for its type
+        audio_path, image_path = await _INPUT_HANDLERS[input_type](message, audio_file, image_file)
         
         # Process chat request
         try:
@@ -154,7 +242,7 @@ async def chat(
                 conversation_history=history,
                 persona=persona
             )
-            return result
+            return ORJSONResponse(result.model_dump())
         
         except ValueError as ve:
             # Handle validation errors from controller
@@ -165,29 +253,22 @@ async def chat(
             
         finally:
             # Cleanup temporary files
-            if audio_path and os.path.exists(audio_path):
-                try:
-                    os.unlink(audio_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp audio file: {str(e)}")
-            
-            if image_path and os.path.exists(image_path):
-                try:
-                    os.unlink(image_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp image file: {str(e)}")
+            await asyncio.gather(
+                _safe_unlink(audio_path, "audio"),
+                _safe_unlink(image_path, "image")
+            )
     
     except HTTPException:
         raise
     except ValueError as ve:
         # Catch any ValueError that escaped the inner try-except
-        logger.error(f"Validation error: {str(ve)}")
+        logger.error("Validation error: %s", ve)
         raise HTTPException(
             status_code=400,
             detail=str(ve)
         )
     except Exception as e:
-        logger.error(f"Chatbot request failed: {str(e)}")
+        logger.error("Chatbot request failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Chatbot processing failed: {str(e)}"
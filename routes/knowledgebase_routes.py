@@ -15,7 +15,7 @@ from models import (
     DocumentDeleteRequest,
     DocumentSearchResponse,
     OperationResponse,
-    CollectionEnum
+    CollectionLiteral
 )
 from controllers import get_knowledgebase_controller, KnowledgeBaseController
 from services.pdf_loader import get_pdf_loader
@@ -136,7 +136,7 @@ async def delete_document(
 
 @router.get("/kb/collection/{collection}/stats", response_model=OperationResponse)
 async def get_collection_stats(
-    collection: CollectionEnum,
+    collection: CollectionLiteral,
     controller: KnowledgeBaseController = Depends(get_knowledgebase_controller)
 ):
     """
@@ -162,7 +162,7 @@ async def get_collection_stats(
 @router.post("/kb/upload-pdf", response_model=OperationResponse)
 async def upload_pdf(
     file: UploadFile = File(..., description="PDF file to upload"),
-    collection: CollectionEnum = Form(..., description="Target collection"),
+    collection: CollectionLiteral = Form(..., description="Target collection"),
     chunk_size: Optional[int] = Form(1000, description="Characters per chunk"),
     controller: KnowledgeBaseController = Depends(get_knowledgebase_controller)
 ):
@@ -5,18 +5,24 @@ Routes for Sanskrit Meaning Engine API
 from fastapi import APIRouter, HTTPException, Depends
 import logging
 
-from models import MeaningRequest, MeaningResponse
+from models import MeaningRequest, MeaningResponse, MeaningBatchRequest, MeaningBatchResponse
 from controllers import get_meaning_controller, MeaningController
+from utils.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+async def _meaning_controller() -> MeaningController:
+    """Resolve the controller singleton inline rather than in the threadpool"""
+    return get_meaning_controller()
+
+
 @router.post("/meaning/extract", response_model=MeaningResponse)
 async def extract_meaning(
     request: MeaningRequest,
-    controller: MeaningController = Depends(get_meaning_controller)
+    controller: MeaningController = Depends(_meaning_controller)
 ):
     """
     Extract meaning and translation from Sanskrit verses
@@ -36,10 +42,38 @@ async def extract_meaning(
     """
     try:
         result = await controller.extract_meaning(request)
-        return result
+        return ORJSONResponse(result.model_dump())
     except Exception as e:
-        logger.error(f"Meaning extraction failed: {str(e)}")
+        logger.error("Meaning extraction failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to extract meaning: {str(e)}"
         )
+
+
+@router.post("/meaning/extract-batch", response_model=MeaningBatchResponse)
+async def extract_meanings_batch(
+    request: MeaningBatchRequest,
+    controller: MeaningController = Depends(_meaning_controller)
+):
+    """
+    Extract meanings for several Sanskrit verses in one call
+    
+    Intended for chapter-level views; verses are bundled into shared LLM
+    requests instead of one round-trip each.
+    
+    Parameters:
+    - **items**: List of meaning requests (verse + options), up to 100
+    
+    Returns:
+    - One translation result per verse, in the same order
+    """
+    try:
+        results = await controller.extract_meanings_batch(request.items)
+        return ORJSONResponse({"results": [result.model_dump() for result in results]})
+    except Exception as e:
+        logger.error("Batch meaning extraction failed: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to extract meanings: {str(e)}"
+        )
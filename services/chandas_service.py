@@ -2,35 +2,71 @@
 Chandas identification service with multiple fallback strategies
 """
 import logging
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Dict, Final, Optional, Any
 import os
 import sys
+import threading
+
+import anyio
+import anyio.to_thread
+
+try:
+    from stuti.chandas import identify_metre as stuti_identify_metre
+    STUTI_AVAILABLE = True
+except ImportError:
+    STUTI_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Result for verses no strategy could identify; callers get shallow copies
+_UNKNOWN_METRE: Final[Dict[str, Any]] = {
+    "metre": "Unknown",
+    "scheme": "",
+    "laghu_guru_pattern": "",
+    "confidence": 0.0,
+    "syllable_count": (),
+    "gana_pattern": "",
+    "detected": False
+}
+
+# Bounds concurrent metre identifications in worker threads; created on first use
+_identify_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+@lru_cache(maxsize=4096)
+def _stuti_identify(verse: str) -> Optional[Dict[str, Any]]:
+    """Run stuti-chandas once per distinct verse; callers must not mutate the result"""
+    return stuti_identify_metre(verse)
+
 
 class ChandasService:
     """Service for identifying Sanskrit chandas"""
     
     _chanda_instance = None
+    _chanda_lock = threading.Lock()
     
     @classmethod
     def _get_chanda_instance(cls):
         """Get or create singleton instance of Chandojñānam"""
+        # Double-checked so concurrent first calls from worker threads build
+        # one instance and don't race on sys.path
         if cls._chanda_instance is None:
-            try:
-                # Add chanda_lib to path
-                chanda_lib_path = os.path.join(os.path.dirname(__file__), '..', 'chanda_lib')
-                if os.path.exists(chanda_lib_path) and chanda_lib_path not in sys.path:
-                    sys.path.insert(0, chanda_lib_path)
-                
-                from chanda import Chanda
-                data_path = os.path.join(chanda_lib_path, 'data')
-                cls._chanda_instance = Chanda(data_path)
-                logger.info("Chandojñānam initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Chandojñānam: {e}")
-                cls._chanda_instance = False  # Mark as unavailable
+            with cls._chanda_lock:
+                if cls._chanda_instance is None:
+                    try:
+                        # Add chanda_lib to path
+                        chanda_lib_path = os.path.join(os.path.dirname(__file__), '..', 'chanda_lib')
+                        if os.path.exists(chanda_lib_path) and chanda_lib_path not in sys.path:
+                            sys.path.insert(0, chanda_lib_path)
+                        
+                        from chanda import Chanda
+                        data_path = os.path.join(chanda_lib_path, 'data')
+                        cls._chanda_instance = Chanda(data_path)
+                        logger.info("Chandojñānam initialized successfully")
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize Chandojñānam: {e}")
+                        cls._chanda_instance = False  # Mark as unavailable
         
         return cls._chanda_instance if cls._chanda_instance is not False else None
     
@@ -53,15 +89,7 @@ class ChandasService:
         cleaned_verse = verse.strip() if verse else ""
         
         if not cleaned_verse:
-            return {
-                "metre": "Unknown",
-                "scheme": "",
-                "laghu_guru_pattern": "",
-                "confidence": 0.0,
-                "syllable_count": [],
-                "gana_pattern": "",
-                "detected": False
-            }
+            return dict(_UNKNOWN_METRE)
         
         # Try Chandojñānam first
         try:
@@ -99,37 +127,51 @@ class ChandasService:
             logger.debug(f"Chandojñānam error: {e}")
         
         # Try stuti-chandas library as fallback
-        try:
-            from stuti.chandas import identify_metre
-            
-            result = identify_metre(cleaned_verse)
-            
-            if result:
-                metre_info = {
-                    "metre": result.get("name", "Unknown"),
-                    "scheme": result.get("pattern", ""),
-                    "laghu_guru_pattern": result.get("laghu_guru", ""),
-                    "confidence": result.get("confidence", 0.0),
-                    "syllable_count": result.get("syllable_count", []),
-                    "gana_pattern": result.get("gana", ""),
-                    "detected": True
-                }
-                logger.info(f"Metre identified using stuti-chandas: {metre_info['metre']}")
-                return metre_info
-                
-        except ImportError:
+        if not STUTI_AVAILABLE:
             logger.debug("stuti-chandas library not installed")
-        except Exception as e:
-            logger.debug(f"stuti-chandas error: {e}")
+        else:
+            try:
+                result = _stuti_identify(cleaned_verse)
+                
+                if result:
+                    # Build a fresh dict so the cached result is never mutated
+                    metre_info = {
+                        "metre": result.get("name", "Unknown"),
+                        "scheme": result.get("pattern", ""),
+                        "laghu_guru_pattern": result.get("laghu_guru", ""),
+                        "confidence": result.get("confidence", 0.0),
+                        "syllable_count": list(result.get("syllable_count", [])),
+                        "gana_pattern": result.get("gana", ""),
+                        "detected": True
+                    }
+                    logger.info(f"Metre identified using stuti-chandas: {metre_info['metre']}")
+                    return metre_info
+                    
+            except Exception as e:
+                logger.debug(f"stuti-chandas error: {e}")
         
         # Return Unknown with low confidence
         logger.warning("Could not identify metre - returning Unknown")
-        return {
-            "metre": "Unknown",
-            "scheme": "",
-            "laghu_guru_pattern": "",
-            "confidence": 0.0,
-            "syllable_count": [],
-            "gana_pattern": "",
-            "detected": False
-        }
+        return dict(_UNKNOWN_METRE)
+    
+    @staticmethod
+    async def identify_metre_async(verse: str) -> Dict[str, Any]:
+        """
+        Identify the metre without blocking the event loop
+        
+        Runs identify_metre in a worker thread, at most one per CPU at a time.
+        
+        Args:
+            verse: Sanskrit verse text
+            
+        Returns:
+            Dictionary with metre information including name, scheme, and confidence
+        """
+        global _identify_limiter
+        
+        if _identify_limiter is None:
+            _identify_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+        
+        return await anyio.to_thread.run_sync(
+            ChandasService.identify_metre, verse, limiter=_identify_limiter
+        )
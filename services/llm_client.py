@@ -7,6 +7,14 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 import asyncio
 
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 try:
     from openai import AsyncOpenAI
     OPENAI_AVAILABLE = True
@@ -36,6 +44,13 @@ from config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Connection pool shared by all provider SDK clients
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=120.0
+)
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers"""
@@ -55,14 +70,25 @@ class LLMClient:
         logger.info(f"🔑 Gemini API key present: {bool(settings.gemini_api_key)}")
         logger.info(f"🔑 Gemini model: {settings.gemini_model}")
         
+        # One keep-alive (HTTP/2 when available) pool reused across requests
+        # so calls don't pay a fresh TCP+TLS handshake
+        self.http_client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+        logger.info(f"🔌 Shared HTTP client initialized (HTTP/2: {HTTP2_AVAILABLE})")
+        
         self.openai_client = None
         if OPENAI_AVAILABLE and settings.openai_api_key:
-            self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+            self.openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=self.http_client
+            )
             logger.info("✅ OpenAI client initialized")
         
         self.anthropic_client = None
         if ANTHROPIC_AVAILABLE and settings.anthropic_api_key:
-            self.anthropic_client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+            self.anthropic_client = AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                http_client=self.http_client
+            )
             logger.info("✅ Anthropic client initialized")
         
         self.gemini_client = None
@@ -81,12 +107,25 @@ class LLMClient:
         
         self.groq_client = None
         if GROQ_AVAILABLE and hasattr(settings, 'groq_api_key') and settings.groq_api_key:
-            self.groq_client = AsyncGroq(api_key=settings.groq_api_key)
+            self.groq_client = AsyncGroq(
+                api_key=settings.groq_api_key,
+                http_client=self.http_client
+            )
             logger.info("✅ Groq client initialized")
         
         self.default_provider = settings.default_llm_provider
         logger.info(f"✅ LLM Client initialized with provider: {self.default_provider}")
     
+    def is_available(self, provider: str) -> bool:
+        """Check whether a provider's client is configured"""
+        clients = {
+            LLMProvider.OPENAI: self.openai_client,
+            LLMProvider.ANTHROPIC: self.anthropic_client,
+            LLMProvider.GEMINI: self.gemini_client,
+            LLMProvider.GROQ: self.groq_client
+        }
+        return clients.get(provider) is not None
+    
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -332,6 +371,11 @@ class LLMClient:
         
         return await self.chat_completion(messages, provider=provider, **kwargs)
     
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool"""
+        await self.http_client.aclose()
+        logger.info("🔌 Shared HTTP client closed")
+    
     async def load_prompt_file(self, filepath: str) -> str:
         """
         Load a prompt template from file
@@ -367,3 +411,9 @@ def get_llm_client() -> LLMClient:
         _llm_client = LLMClient()
     
     return _llm_client
+
+
+async def close_llm_client() -> None:
+    """Close the LLM client singleton's connections, if it was created"""
+    if _llm_client is not None:
+        await _llm_client.aclose()
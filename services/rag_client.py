@@ -160,8 +160,7 @@ class RAGClient:
             str: Document ID
         """
         try:
-            # Convert enum to string if needed
-            collection_name = str(collection.value) if hasattr(collection, 'value') else str(collection)
+            collection_name = str(collection)
             
             doc_id = str(uuid.uuid4())
             
@@ -216,8 +215,7 @@ class RAGClient:
             List of matching documents with scores
         """
         try:
-            # Convert enum to string if needed
-            collection_name = str(collection.value) if hasattr(collection, 'value') else str(collection)
+            collection_name = str(collection)
             
             # Generate embedding from query text if not provided
             if query_embedding is None and query_text:
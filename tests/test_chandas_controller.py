@@ -0,0 +1,181 @@
+"""
+Tests for the chandas controller's LLM result cache
+"""
+
+import asyncio
+import threading
+
+import orjson
+import pytest
+
+import controllers.chandas_controller as chandas_controller
+from models import ChandasIdentifyRequest
+
+# 24 syllables: three Anushtup quarters, below the pattern detector's exact-match confidence
+SHLOKA = "क" * 24
+
+
+class FakeLLMClient:
+    """LLM client stub that answers every request with a fixed meter"""
+
+    def __init__(self):
+        self.calls = 0
+        self.called = threading.Event()
+
+    def is_available(self, provider: str) -> bool:
+        return False
+
+    async def chat_completion(self, messages, **kwargs) -> str:
+        self.calls += 1
+        self.called.set()
+        answer = {
+            "chandas_name": "LLM-Answer",
+            "explanation": "Answered by the LLM",
+            "confidence": 0.99
+        }
+        # Batched prompts number their shlokas and expect one answer each
+        count = messages[-1]["content"].count("Shloka ")
+        if count:
+            return orjson.dumps({"results": [answer] * count}).decode()
+        return orjson.dumps(answer).decode()
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    llm_client = FakeLLMClient()
+    monkeypatch.setattr(chandas_controller, "get_llm_client", lambda: llm_client)
+    monkeypatch.setattr(chandas_controller, "get_rag_client", lambda: None)
+    return chandas_controller.ChandasController()
+
+
+@pytest.mark.asyncio
+async def test_repeated_shloka_is_served_from_cache(controller):
+    request = ChandasIdentifyRequest(shloka=SHLOKA)
+
+    first = await controller.identify_chandas(request)
+    second = await controller.identify_chandas(request)
+
+    assert (first.chandas_name, first.confidence) == ("LLM-Answer", 0.99)
+    assert (second.chandas_name, second.confidence) == ("LLM-Answer", 0.99)
+    assert controller.llm_client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_request_does_not_wait_for_the_detector(controller, monkeypatch):
+    detect_chandas = chandas_controller.detect_chandas
+    llm_called_during_detection = []
+
+    def slow_detect_chandas(text):
+        # Holds the detector until the LLM is called; a sequential
+        # implementation only reaches the LLM after this times out
+        llm_called_during_detection.append(controller.llm_client.called.wait(timeout=1))
+        return detect_chandas(text)
+
+    monkeypatch.setattr(chandas_controller, "detect_chandas", slow_detect_chandas)
+
+    result = await controller.identify_chandas(ChandasIdentifyRequest(shloka=SHLOKA))
+
+    assert llm_called_during_detection[0] is True
+    assert result.chandas_name == "LLM-Answer"
+
+
+@pytest.mark.asyncio
+async def test_aclose_stops_the_batcher(controller):
+    await controller.identify_chandas(ChandasIdentifyRequest(shloka=SHLOKA))
+    worker = controller._batch_worker
+
+    await controller.aclose()
+
+    assert worker.cancelled()
+    assert not controller._batch_tasks
+
+
+@pytest.mark.parametrize("llm_name", ["Anushtup", "anushtubh", "Anuṣṭup", "Anuṣṭubh (Shloka)"])
+def test_anushtup_answer_is_relabelled_by_quarter_length(controller, llm_name):
+    result = {"chandas_name": llm_name}
+    pattern_result = {"syllable_breakdown": [{}] * 44}
+
+    controller._correct_anushtup_label(result, pattern_result)
+
+    assert result["chandas_name"] == "Trishtubh"
+
+
+@pytest.mark.asyncio
+async def test_schema_invalid_llm_result_is_not_cached(controller, monkeypatch):
+    replies = iter([
+        {"chandas_name": "LLM-Answer", "confidence": 95},
+        {"chandas_name": "LLM-Answer", "confidence": 0.95}
+    ])
+
+    async def chat_completion(messages, **kwargs):
+        controller.llm_client.calls += 1
+        return orjson.dumps(next(replies)).decode()
+
+    monkeypatch.setattr(controller.llm_client, "chat_completion", chat_completion)
+    request = ChandasIdentifyRequest(shloka=SHLOKA)
+
+    first = await controller.identify_chandas(request)
+    second = await controller.identify_chandas(request)
+
+    # The invalid reply falls back to the detector and the repeat asks the LLM again
+    assert first.chandas_name != "LLM-Answer"
+    assert (second.chandas_name, second.confidence) == ("LLM-Answer", 0.95)
+    assert controller.llm_client.calls == 2
+
+
+def _stub_detector(monkeypatch, pattern):
+    """Make the detector report Indravajra at 0.95 for the given laghu/guru pattern"""
+    def detect_chandas(text):
+        return {
+            "chandas_name": "Indravajra",
+            "syllable_breakdown": [
+                {"syllable": "क", "type": "laghu" if kind == "L" else "guru", "position": i}
+                for i, kind in enumerate(pattern, start=1)
+            ],
+            "laghu_guru_pattern": pattern,
+            "explanation": "Pattern match",
+            "confidence": 0.95
+        }
+
+    monkeypatch.setattr(chandas_controller, "detect_chandas", detect_chandas)
+
+
+@pytest.mark.asyncio
+async def test_mixed_quarters_wait_for_the_llm(controller, monkeypatch):
+    # Upajati: one Indravajra quarter followed by three Upendravajra quarters
+    _stub_detector(monkeypatch, "GGLGGLLGLLG" + "LGLGGLLGLLG" * 3)
+
+    result = await controller.identify_chandas(ChandasIdentifyRequest(shloka=SHLOKA))
+
+    assert result.chandas_name == "LLM-Answer"
+
+
+@pytest.mark.asyncio
+async def test_exact_quarters_win_without_the_llm(controller, monkeypatch):
+    _stub_detector(monkeypatch, "GGLGGLLGLLG" * 4)
+
+    result = await controller.identify_chandas(ChandasIdentifyRequest(shloka=SHLOKA))
+
+    assert (result.chandas_name, result.confidence) == ("Indravajra", 0.95)
+
+
+@pytest.mark.asyncio
+async def test_missing_breakdown_is_filled_from_the_detector_run(controller, monkeypatch):
+    detect_chandas = chandas_controller.detect_chandas
+    detected = []
+
+    def counting_detect_chandas(text):
+        detected.append(text)
+        return detect_chandas(text)
+
+    monkeypatch.setattr(chandas_controller, "detect_chandas", counting_detect_chandas)
+    shlokas = [SHLOKA, "ग" * 24]
+
+    # Concurrent requests go out as one batch
+    results = await asyncio.gather(
+        *(controller.identify_chandas(ChandasIdentifyRequest(shloka=shloka)) for shloka in shlokas)
+    )
+
+    assert controller.llm_client.calls == 1
+    assert sorted(detected) == sorted(shlokas)
+    assert all(len(result.syllable_breakdown) == 24 for result in results)
@@ -0,0 +1,29 @@
+"""
+Tests for meter name lookup in utils.chandas_patterns
+"""
+
+import pytest
+
+from utils.chandas_patterns import CHANDAS_PATTERNS, get_chandas_pattern
+
+
+@pytest.mark.parametrize("name, canonical", [
+    ("Anushtup", "Anushtup"),
+    ("anushtup", "Anushtup"),
+    ("Anuṣṭup", "Anushtup"),
+    ("Anustup", "Anushtup"),
+    ("Anuṣṭubh", "Anushtup"),
+    ("Anushtubh", "Anushtup"),
+    ("Indravajrā", "Indravajra"),
+    ("Mālinī", "Malini"),
+    ("Vasantatilakā", "Vasantatilaka"),
+    ("Śārdūlavikrīḍita", "Shardula-vikridita"),
+    ("Shardula vikridita", "Shardula-vikridita"),
+])
+def test_spellings_resolve_to_the_canonical_meter(name, canonical):
+    assert get_chandas_pattern(name) is CHANDAS_PATTERNS[canonical]
+
+
+@pytest.mark.parametrize("name", ["", "Gayatri", None, 32])
+def test_unknown_or_invalid_names_return_none(name):
+    assert get_chandas_pattern(name) is None
@@ -0,0 +1,146 @@
+"""
+Tests for SingleFlightCache and the startup route check
+"""
+
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from utils.helpers import SingleFlightCache, check_unique_routes
+
+
+class Factory:
+    """Counts calls and returns a value after an optional delay"""
+
+    def __init__(self, value="value", delay=0.01):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call():
+    cache = SingleFlightCache()
+    factory = Factory()
+
+    results = await asyncio.gather(*(cache.get_or_create("key", factory) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert factory.calls == 1
+    assert await cache.get_or_create("key", factory) == "value"
+    assert factory.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_keeps_followers_alive():
+    cache = SingleFlightCache()
+    factory = Factory(delay=0.05)
+
+    leader = asyncio.create_task(cache.get_or_create("key", factory))
+    follower = asyncio.create_task(cache.get_or_create("key", factory))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == "value"
+    assert factory.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_last_waiter_leaving_cancels_the_shared_work():
+    cache = SingleFlightCache()
+    cancelled = asyncio.Event()
+
+    async def factory():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(cache.get_or_create("key", factory))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_caller_arriving_during_cancellation_starts_fresh_work():
+    cache = SingleFlightCache()
+    factory = Factory()
+
+    caller = asyncio.create_task(cache.get_or_create("key", factory))
+    await asyncio.sleep(0)
+    caller.cancel()
+    # Let the cancelled caller abandon the shared task, but not the task finish
+    await asyncio.sleep(0)
+
+    assert await cache.get_or_create("key", factory) == "value"
+    assert factory.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_exceptions_reach_every_waiter_and_are_not_cached():
+    cache = SingleFlightCache()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        cache.get_or_create("key", failing),
+        cache.get_or_create("key", failing),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 1
+    assert await cache.get_or_create("key", Factory()) == "value"
+
+
+@pytest.mark.asyncio
+async def test_values_failing_cache_if_are_returned_but_not_cached():
+    cache = SingleFlightCache()
+    factory = Factory(value="partial")
+
+    first = await cache.get_or_create("key", factory, cache_if=lambda value: value != "partial")
+    second = await cache.get_or_create("key", factory, cache_if=lambda value: value != "partial")
+
+    assert first == second == "partial"
+    assert factory.calls == 2
+
+
+def _router(path):
+    router = APIRouter()
+
+    @router.post(path)
+    async def handler():
+        return {}
+
+    return router
+
+
+def test_check_unique_routes_detects_duplicates_in_included_routers():
+    app = FastAPI()
+    app.include_router(_router("/chandas/identify"), prefix="/api/v1")
+    app.include_router(_router("/chandas/identify"), prefix="/api/v1")
+
+    with pytest.raises(RuntimeError, match="POST /api/v1/chandas/identify"):
+        check_unique_routes(app.routes)
+
+
+def test_check_unique_routes_accepts_distinct_routes():
+    app = FastAPI()
+    app.include_router(_router("/chandas/identify"), prefix="/api/v1")
+    app.include_router(_router("/meaning/extract"), prefix="/api/v1")
+
+    check_unique_routes(app.routes)
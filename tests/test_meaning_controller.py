@@ -0,0 +1,100 @@
+"""
+Tests for batched meaning extraction and its response cache
+"""
+
+import re
+
+import orjson
+import pytest
+
+import controllers.meaning_controller as meaning_controller
+from models import MeaningRequest
+
+
+class FakeLLMClient:
+    """LLM client stub that translates each verse as "T:<verse>" """
+
+    def __init__(self):
+        self.prompts = []
+        self.malformed = set()
+
+    def _answer(self, verse):
+        if verse in self.malformed:
+            return {"translation": f"T:{verse}", "word_meanings": {"word": 1}}
+        return {"translation": f"T:{verse}"}
+
+    async def structured_completion(self, system_prompt, user_prompt, **kwargs) -> str:
+        self.prompts.append(user_prompt)
+        batched = re.findall(r"^Verse \d+: (.*)$", user_prompt, re.MULTILINE)
+        if batched:
+            return orjson.dumps({"results": [self._answer(verse) for verse in batched]}).decode()
+        verse = re.search(r"^Verse: (.*)$", user_prompt, re.MULTILINE).group(1)
+        return orjson.dumps({"translation": f"T:{verse}"}).decode()
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    llm_client = FakeLLMClient()
+    monkeypatch.setattr(meaning_controller, "get_llm_client", lambda: llm_client)
+    monkeypatch.setattr(meaning_controller, "get_rag_client", lambda: None)
+    return meaning_controller.MeaningController()
+
+
+def _requests(*verses):
+    return [MeaningRequest(verse=verse) for verse in verses]
+
+
+@pytest.mark.asyncio
+async def test_repeated_verses_in_a_batch_are_translated_once(controller):
+    results = await controller.extract_meanings_batch(_requests("a", "b", "a"))
+
+    assert [result.translation for result in results] == ["T:a", "T:b", "T:a"]
+    assert len(controller.llm_client.prompts) == 1
+    assert controller.llm_client.prompts[0].count("Verse ") == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_reuses_single_extraction_cache(controller):
+    await controller.extract_meaning(MeaningRequest(verse="a"))
+
+    results = await controller.extract_meanings_batch(_requests("a"))
+
+    assert results[0].translation == "T:a"
+    assert len(controller.llm_client.prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_results_are_cached_for_later_requests(controller):
+    await controller.extract_meanings_batch(_requests("a", "b"))
+
+    single = await controller.extract_meaning(MeaningRequest(verse="b"))
+    batch = await controller.extract_meanings_batch(_requests("a", "b"))
+
+    assert single.translation == "T:b"
+    assert [result.translation for result in batch] == ["T:a", "T:b"]
+    assert len(controller.llm_client.prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_batch_item_is_retried_individually(controller):
+    controller.llm_client.malformed.add("b")
+
+    results = await controller.extract_meanings_batch(_requests("a", "b"))
+
+    assert [result.translation for result in results] == ["T:a", "T:b"]
+    assert len(controller.llm_client.prompts) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_translations_are_not_cached(controller, monkeypatch):
+    async def unparseable(system_prompt, user_prompt, **kwargs):
+        controller.llm_client.prompts.append(user_prompt)
+        return "not json"
+
+    monkeypatch.setattr(controller.llm_client, "structured_completion", unparseable)
+
+    await controller.extract_meanings_batch(_requests("a", "b"))
+    await controller.extract_meanings_batch(_requests("a", "b"))
+
+    # Each unsplittable batch falls back to one request per verse, every time
+    assert len(controller.llm_client.prompts) == 6
@@ -15,6 +15,7 @@ from .splitter import SanskritSplitter, get_splitter
 
 from .helpers import (
     format_timestamp,
+    read_prompt,
     truncate_text,
     extract_json_from_text,
     sanitize_filename,
@@ -25,7 +26,9 @@ from .helpers import (
     safe_divide,
     count_words,
     get_file_extension,
-    ProgressTracker
+    check_unique_routes,
+    ProgressTracker,
+    SingleFlightCache
 )
 
 __all__ = [
@@ -43,6 +46,7 @@ __all__ = [
     'get_splitter',
     # helpers
     'format_timestamp',
+    'read_prompt',
     'truncate_text',
     'extract_json_from_text',
     'sanitize_filename',
@@ -53,5 +57,7 @@ __all__ = [
     'safe_divide',
     'count_words',
     'get_file_extension',
-    'ProgressTracker'
+    'check_unique_routes',
+    'ProgressTracker',
+    'SingleFlightCache'
 ]
@@ -2,11 +2,23 @@
 Chandas pattern detection without LLM - pure algorithmic approach.
 """
 import re
-from typing import Dict, List, Tuple, Any
+import sys
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Any
 
 
-# Syllable patterns for common meters
-CHANDAS_PATTERNS = {
+# Fixed-field record for one meter; attribute access is a tuple index rather
+# than a dict hash, and entries are immutable so they can be shared freely
+ChandasPattern = namedtuple(
+    "ChandasPattern",
+    ["syllables_per_line", "total_syllables", "pattern", "description"]
+)
+
+# Syllable patterns for common meters, as readable source data
+_RAW_PATTERNS = {
     "Anushtup": {
         "syllables_per_line": 8,
         "total_syllables": 32,
@@ -45,6 +57,73 @@ CHANDAS_PATTERNS = {
     }
 }
 
+# Entries are shared by name and alias lookups, so hand them out read-only
+CHANDAS_PATTERNS = MappingProxyType(
+    {name: ChandasPattern(**info) for name, info in _RAW_PATTERNS.items()}
+)
+
+
+@lru_cache(maxsize=256)
+def _norm(name: str) -> str:
+    """Fold a meter name to its lookup key: diacritics, case and separators dropped"""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]", "", ascii_name.casefold())
+
+
+# Alternative spellings of the meters above that don't fold to the canonical
+# name. _norm drops diacritics, so IAST spellings fold to their bare letters:
+# "Anuṣṭup" becomes "anustup", not "anushtup", and needs its own entry
+_ALIASES = {
+    "Anushtubh": "Anushtup",
+    "Anustup": "Anushtup",
+    "Anustubh": "Anushtup",
+    "Sardulavikridita": "Shardula-vikridita"
+}
+
+# Normalized name lookup, built once so get_chandas_pattern is a single probe.
+# Aliases share the canonical entry's info object. Keys are interned so probes
+# with an interned name match on identity; names coming from user input still
+# fall back to a normal hash + compare.
+_PATTERNS_NORMALIZED = {sys.intern(_norm(name)): info for name, info in CHANDAS_PATTERNS.items()}
+for _alias, _canonical in _ALIASES.items():
+    _PATTERNS_NORMALIZED[sys.intern(_norm(_alias))] = CHANDAS_PATTERNS[_canonical]
+
+# Meter family for verses of four equal quarters, keyed by syllables per quarter
+METER_BY_QUARTER_LENGTH = {
+    8: "Anushtup",
+    11: "Trishtubh",
+    12: "Jagati",
+    14: "Vasantatilaka",
+    15: "Malini",
+    19: "Shardula-vikridita"
+}
+
+# Candidate meters keyed by total syllable count, built once at import so
+# matching a verse only inspects meters of the right length
+_PATTERNS_BY_TOTAL: Dict[int, List[Tuple[str, ChandasPattern]]] = {}
+for _name, _info in CHANDAS_PATTERNS.items():
+    _PATTERNS_BY_TOTAL.setdefault(_info.total_syllables, []).append((_name, _info))
+
+
+def get_chandas_pattern(metre_name: str) -> Optional[ChandasPattern]:
+    """
+    Look up a known meter's pattern info by name, ignoring case and diacritics
+    
+    Args:
+        metre_name: Meter name, e.g. "Indravajra", "malini" or "Śārdūlavikrīḍita"
+        
+    Returns:
+        The meter's ChandasPattern, or None if the meter is unknown
+    """
+    # Non-str keys would knock the str-only tables off CPython's fast lookup path
+    if not metre_name or not isinstance(metre_name, str):
+        return None
+    # Most callers pass the canonical name, which needs no normalization
+    hit = CHANDAS_PATTERNS.get(metre_name)
+    if hit is not None:
+        return hit
+    return _PATTERNS_NORMALIZED.get(_norm(metre_name))
+
 
 def split_into_syllables(text: str) -> List[str]:
     """Split Sanskrit text into syllables with improved handling."""
@@ -117,14 +196,15 @@ def detect_chandas(text: str) -> Dict[str, Any]:
     syllables = split_into_syllables(text)
     total_syllables = len(syllables)
     
-    # Classify each syllable
+    # Classify each syllable; the pattern string is joined once at the end
+    # instead of being rebuilt on every syllable
     syllable_breakdown = []
-    pattern_str = ""
+    classifications = []
     
     for i, syl in enumerate(syllables):
-        is_end = (i == len(syllables) - 1)
+        is_end = (i == total_syllables - 1)
         classification = classify_syllable(syl, is_end)
-        pattern_str += classification
+        classifications.append(classification)
         
         syllable_breakdown.append({
             "syllable": syl,
@@ -132,23 +212,26 @@ def detect_chandas(text: str) -> Dict[str, Any]:
             "position": i + 1
         })
     
+    pattern_str = "".join(classifications)
+    
     # Match against known patterns
     best_match = None
+    best_info = None
     best_confidence = 0.0
     
-    for chandas_name, info in CHANDAS_PATTERNS.items():
-        # Check syllable count
-        if info["total_syllables"] == total_syllables:
-            if info["pattern"] is None:
-                # Anushtup - flexible pattern
-                best_match = chandas_name
-                best_confidence = 0.85
-                break
-            elif info["pattern"] in pattern_str or pattern_str in info["pattern"]:
-                # Pattern matches
-                best_match = chandas_name
-                best_confidence = 0.95
-                break
+    for chandas_name, info in _PATTERNS_BY_TOTAL.get(total_syllables, ()):
+        if info.pattern is None:
+            # Anushtup - flexible pattern
+            best_match = chandas_name
+            best_info = info
+            best_confidence = 0.85
+            break
+        elif info.pattern in pattern_str or pattern_str in info.pattern:
+            # Pattern matches
+            best_match = chandas_name
+            best_info = info
+            best_confidence = 0.95
+            break
     
     # Special handling for partial verses or Anushtup
     if best_match is None:
@@ -175,10 +258,8 @@ def detect_chandas(text: str) -> Dict[str, Any]:
                 best_confidence = 0.3
                 explanation = f"Detected {total_syllables} syllables - no standard pattern match"
     else:
-        explanation = CHANDAS_PATTERNS.get(best_match, {}).get(
-            "description",
-            f"Detected {total_syllables} total syllables"
-        )
+        # Reuse the matched entry rather than looking the name up again
+        explanation = best_info.description or f"Detected {total_syllables} total syllables"
     
     return {
         "chandas_name": best_match,
@@ -3,10 +3,15 @@ Helper utilities for Sanskrit AI backend
 """
 
 import re
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Optional, Dict, Any, Awaitable, Callable, Hashable, Iterable, Iterator, Tuple
 from datetime import datetime
 
+from cachetools import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +30,23 @@ def format_timestamp(dt: Optional[datetime] = None) -> str:
     return dt.isoformat()
 
 
+@lru_cache(maxsize=32)
+def read_prompt(path: str) -> Optional[str]:
+    """
+    Read a prompt file, caching its contents for the life of the process
+    
+    Args:
+        path: Path to the prompt file
+        
+    Returns:
+        File contents, or None if the file does not exist
+    """
+    prompt_path = Path(path)
+    if not prompt_path.exists():
+        return None
+    return prompt_path.read_text(encoding="utf-8")
+
+
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
     Truncate text to maximum length
@@ -216,6 +238,38 @@ def get_file_extension(filename: str) -> str:
     return filename.rsplit('.', 1)[-1].lower()
 
 
+def _iter_route_keys(routes: Iterable[Any], prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yield (path, method) for every route, descending into included routers"""
+    for route in routes:
+        # Newer FastAPI keeps included routers as wrappers around the
+        # original router instead of copying its routes with the prefix applied
+        included = getattr(route, "original_router", None)
+        if included is not None:
+            yield from _iter_route_keys(included.routes, prefix + route.include_context.prefix)
+            continue
+        
+        for method in getattr(route, "methods", None) or ():
+            yield prefix + route.path, method
+
+
+def check_unique_routes(routes: Iterable[Any]) -> None:
+    """
+    Fail fast if two handlers are registered for the same path and method
+    
+    Args:
+        routes: Application routes, e.g. ``app.routes``
+        
+    Raises:
+        RuntimeError: If a (path, method) pair is registered twice
+    """
+    seen = set()
+    for key in _iter_route_keys(routes):
+        if key in seen:
+            path, method = key
+            raise RuntimeError(f"Duplicate route registered: {method} {path}")
+        seen.add(key)
+
+
 class ProgressTracker:
     """Simple progress tracker for long-running operations"""
     
@@ -235,3 +289,86 @@ class ProgressTracker:
         """Mark as complete"""
         elapsed = (datetime.now() - self.start_time).total_seconds()
         logger.info(f"{self.description} completed in {elapsed:.2f} seconds")
+
+
+class SingleFlightCache:
+    """
+    TTL-bounded cache for async results that coalesces concurrent misses
+    
+    The first miss for a key starts the factory in a task owned by the cache;
+    every caller, the first included, awaits that task behind a shield, so
+    one caller being cancelled never cancels the others. The task is only
+    cancelled once no caller is left waiting on it. Exceptions reach every
+    waiter but are never cached.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss; never computes"""
+        return self._cache.get(key)
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value computed outside get_or_create, e.g. by a batched request"""
+        self._cache[key] = value
+    
+    async def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing it once if missing
+        
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value on a miss
+            cache_if: Optional predicate; values failing it are returned but not cached
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        
+        task = self._inflight.get(key)
+        # Never join work that has finished or is being cancelled; its
+        # done callback may not have run yet
+        if task is None or task.done() or task.cancelling():
+            task = asyncio.create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._on_done, key, cache_if))
+        
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters.pop(task) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            elif not task.done():
+                # Last waiter gone (cancelled) - the result has no consumer.
+                # Retire it in the same step so no new caller can join it
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                task.cancel()
+    
+    def _on_done(self, key: Hashable, cache_if: Optional[Callable[[Any], bool]], task: asyncio.Task) -> None:
+        """Retire a finished in-flight task and cache its value if eligible"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        
+        # exception() also marks the error retrieved, so a failure without
+        # waiters doesn't log a warning
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        value = task.result()
+        if cache_if is None or cache_if(value):
+            self._cache[key] = value